@@ -1,22 +1,41 @@
 """
 HelioCast Backend API
 =====================
-Flask REST API for solar power generation forecasting using LSTM model.
+FastAPI REST API for solar power generation forecasting using LSTM model.
 
 Author: HelioCast Team
 Date: 2025
 """
 
-from flask import Flask, request, jsonify
-from flask_cors import CORS
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ValidationError
+from cachetools import TTLCache
 import tensorflow as tf
 import joblib
 import numpy as np
+import asyncio
 import os
+import threading
+from datetime import datetime
 
-# Initialize Flask app
-app = Flask(__name__)
-CORS(app)  # Enable CORS for all routes to allow frontend access
+# Initialize FastAPI app
+# Responses are serialized with orjson, which also handles NumPy values
+# Debug mode stays off so errors never return tracebacks to clients
+app = FastAPI(
+    title='HelioCast Solar Forecasting API',
+    version='1.0.0',
+    default_response_class=ORJSONResponse,
+    debug=False
+)
+# Enable CORS for all routes to allow frontend access
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=['*'],
+    allow_methods=['*'],
+    allow_headers=['*']
+)
 
 # Get the directory where this script is located
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -26,36 +45,303 @@ MODEL_PATH = os.path.join(BASE_DIR, 'solar_lstm_forecast_model.keras')
 X_SCALER_PATH = os.path.join(BASE_DIR, 'X_scaler.save')
 Y_SCALER_PATH = os.path.join(BASE_DIR, 'y_scaler.save')
 
+# Quantization applied when converting the LSTM to TFLite:
+#   'dynamic' - int8 weights with float32 activations and I/O (default)
+#   'float16' - float16 weights, upcast to float32 by CPU kernels
+# Full int8 is not offered: with TF 2.20 calibrating this BiLSTM crashes the
+# converter, and one int8 output step would be ~80 MW over the power range.
+TFLITE_QUANTIZATION_MODES = ('dynamic', 'float16')
+TFLITE_QUANTIZATION = os.environ.get('TFLITE_QUANTIZATION', 'dynamic')
+TFLITE_MODEL_PATH = os.path.join(
+    BASE_DIR, f'solar_lstm_forecast_model_{TFLITE_QUANTIZATION}.tflite'
+)
+
+# Threads each interpreter may use for inference. Lower this when running
+# several server worker processes so they do not oversubscribe the CPU.
+INFERENCE_THREADS = int(os.environ.get('INFERENCE_THREADS', os.cpu_count() or 1))
+tf.config.threading.set_intra_op_parallelism_threads(INFERENCE_THREADS)
+tf.config.threading.set_inter_op_parallelism_threads(1)
+
+# Optional path to a standalone XNNPACK delegate library. Without it the
+# interpreter applies the XNNPACK delegate built into TensorFlow Lite.
+XNNPACK_DELEGATE_PATH = os.environ.get('XNNPACK_DELEGATE_PATH')
+
+# Forecast horizon and the change (MW) below which the batched forecast
+# is considered converged; smaller than the 2-decimal response rounding
+FORECAST_HOURS = 24
+FORECAST_TOLERANCE = 0.005
+# Cyclical (sin, cos) encodings of every month (1-12) and forecast hour,
+# computed the same way as in training
+MONTH_TRIG = np.stack([
+    np.sin(2 * np.pi * np.arange(1, 13) / 12),
+    np.cos(2 * np.pi * np.arange(1, 13) / 12)
+], axis=1).astype(np.float32)
+HOUR_TRIG = np.stack([
+    np.sin(2 * np.pi * np.arange(FORECAST_HOURS) / 24),
+    np.cos(2 * np.pi * np.arange(FORECAST_HOURS) / 24)
+], axis=1).astype(np.float32)
+
+TFLITE_FORECAST_MODEL_PATH = os.path.join(
+    BASE_DIR,
+    f'solar_lstm_forecast_model_{TFLITE_QUANTIZATION}_batch{FORECAST_HOURS}.tflite'
+)
+
+# Recent /predict results, keyed on the raw feature vector rounded to
+# 3 decimals, so polling clients repeating a query skip inference
+PREDICTION_CACHE_SIZE = 1024
+PREDICTION_CACHE_TTL = 60  # seconds
+prediction_cache = TTLCache(maxsize=PREDICTION_CACHE_SIZE, ttl=PREDICTION_CACHE_TTL)
+prediction_cache_lock = threading.Lock()
+
+# Per-thread scratch buffers, so concurrent inference threads never share one
+thread_local = threading.local()
+
+
+def check_quantization(quantization):
+    """
+    Raise ValueError unless quantization is a supported TFLite mode.
+    """
+    if quantization not in TFLITE_QUANTIZATION_MODES:
+        raise ValueError(
+            f"Unsupported TFLite quantization mode {quantization!r}; "
+            f"expected one of {', '.join(TFLITE_QUANTIZATION_MODES)}"
+        )
+
+
+def build_inference_model(keras_model, batch_size=1):
+    """
+    Rebuild the trained layers on a fixed (batch_size, 1, 12) input.
+
+    The saved model declares the 72-step windows it was trained on, while
+    the API feeds one step at a time; the layers themselves accept any
+    sequence length. A static input shape also lets the converter emit
+    fused LSTM kernels.
+    """
+    inputs = tf.keras.Input(shape=(1, 12), batch_size=batch_size)
+    outputs = inputs
+    for layer in keras_model.layers:
+        outputs = layer(outputs)
+    return tf.keras.Model(inputs, outputs)
+
+
+def convert_to_tflite(keras_model, batch_size=1, quantization=TFLITE_QUANTIZATION):
+    """
+    Convert the Keras LSTM into a quantized TFLite FlatBuffer for inputs
+    of shape (batch_size, 1, 12). Weights are quantized; activations and
+    I/O stay float32.
+    """
+    check_quantization(quantization)
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(
+        build_inference_model(keras_model, batch_size)
+    )
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    if quantization == 'float16':
+        converter.target_spec.supported_types = [tf.float16]
+    return converter.convert()
+
+
+def load_tflite_models():
+    """
+    Return the TFLite FlatBuffers for /predict and /forecast, converting
+    the Keras model on first use.
+
+    /predict gets a model specialized to a single sample and /forecast one
+    specialized to a whole forecast day. Both are cached next to the Keras
+    model and rebuilt whenever the Keras file is newer than the cache.
+    """
+    # Checked before the caches are read, so a leftover file from a mode
+    # that is no longer supported is never loaded
+    check_quantization(TFLITE_QUANTIZATION)
+
+    keras_model = None
+    tflite_models = []
+    for batch_size, path in ((1, TFLITE_MODEL_PATH),
+                             (FORECAST_HOURS, TFLITE_FORECAST_MODEL_PATH)):
+        if (os.path.exists(path)
+                and os.path.getmtime(path) >= os.path.getmtime(MODEL_PATH)):
+            with open(path, 'rb') as f:
+                tflite_models.append(f.read())
+            continue
+
+        if keras_model is None:
+            keras_model = tf.keras.models.load_model(MODEL_PATH)
+        tflite_model = convert_to_tflite(keras_model, batch_size)
+        # Write atomically, since several server workers may convert at once
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(tflite_model)
+        os.replace(tmp_path, path)
+        tflite_models.append(tflite_model)
+    return tflite_models
+
+
+class TFLiteModel:
+    """
+    Lock-protected wrapper around a single TFLite interpreter.
+
+    A TFLite interpreter is not thread-safe, so every invocation goes
+    through one lock shared by all request threads.
+    """
+
+    def __init__(self, model_content, num_threads=INFERENCE_THREADS):
+        delegates = None
+        if XNNPACK_DELEGATE_PATH:
+            delegates = [tf.lite.experimental.load_delegate(XNNPACK_DELEGATE_PATH)]
+        self.interpreter = tf.lite.Interpreter(
+            model_content=model_content,
+            num_threads=num_threads,
+            experimental_delegates=delegates,
+            experimental_op_resolver_type=tf.lite.experimental.OpResolverType.BUILTIN
+        )
+        self.interpreter.allocate_tensors()
+
+        input_details = self.interpreter.get_input_details()[0]
+        output_details = self.interpreter.get_output_details()[0]
+        self.input_index = input_details['index']
+        self.output_index = output_details['index']
+        # Accessors returning NumPy views onto the interpreter's own buffers.
+        # The views must not be held across invoke(), so they are fetched
+        # fresh for every call.
+        self.input_tensor = self.interpreter.tensor(self.input_index)
+        self.output_tensor = self.interpreter.tensor(self.output_index)
+        self.lock = threading.Lock()
+
+    def predict(self, features_scaled):
+        """
+        Run the LSTM on scaled features matching the interpreter's
+        (batch, 1, 12) input shape.
+
+        Features are written straight into the interpreter's input buffer
+        and the output is copied out of its output buffer, skipping the
+        per-call validation and copies of set_tensor/get_tensor.
+        """
+        with self.lock:
+            self.input_tensor()[...] = features_scaled
+            self.interpreter.invoke()
+            return self.output_tensor().copy()
+
+
 print("Loading model and scalers...")
 try:
-    model = tf.keras.models.load_model(MODEL_PATH)
     X_scaler = joblib.load(X_SCALER_PATH)
     y_scaler = joblib.load(Y_SCALER_PATH)
+    # MinMaxScaler parameters cached as float32 so scaling is one fused
+    # multiply-add instead of a round trip through sklearn's validation
+    X_scale = X_scaler.scale_.astype(np.float32)
+    X_min = X_scaler.min_.astype(np.float32)
+    y_inv_scale = (1.0 / y_scaler.scale_).astype(np.float32)
+    y_offset = (-y_scaler.min_ / y_scaler.scale_).astype(np.float32)
+    tflite_model, tflite_forecast_model = load_tflite_models()
+    # A single sample is too small to split across threads, so /predict
+    # runs single-threaded for the lowest latency
+    model = TFLiteModel(tflite_model, num_threads=1)
+    # Second interpreter that predicts a whole forecast day in one call
+    forecast_model = TFLiteModel(tflite_forecast_model)
     print("✓ Model and scalers loaded successfully!")
+    
+    # Run each interpreter once so the first request does not pay for
+    # lazy kernel preparation and thread-pool startup
+    model.predict(np.zeros((1, 1, 12), np.float32))
+    forecast_model.predict(np.zeros((FORECAST_HOURS, 1, 12), np.float32))
 except Exception as e:
     print(f"✗ Error loading model or scalers: {e}")
     model = None
+    forecast_model = None
     X_scaler = None
     y_scaler = None
+    X_scale = X_min = y_inv_scale = y_offset = None
+
+
+def scale_features(features, out=None):
+    """
+    Scale raw features; equivalent to X_scaler.transform.
+    """
+    out = np.multiply(features, X_scale, out=out)
+    out += X_min
+    return out
 
 
-@app.route('/', methods=['GET'])
-def home():
+def get_predict_buffer():
+    """
+    Return this thread's reusable (1, 1, 12) float32 buffer for /predict.
+    """
+    buffer = getattr(thread_local, 'predict_buffer', None)
+    if buffer is None:
+        buffer = thread_local.predict_buffer = np.empty((1, 1, 12), dtype=np.float32)
+    return buffer
+
+
+def unscale_power(prediction_scaled):
+    """
+    Map scaled model output back to MW; equivalent to y_scaler.inverse_transform.
+    """
+    return prediction_scaled * y_inv_scale + y_offset
+
+
+class PredictRequest(BaseModel):
+    """
+    /predict request body.
+
+    Fields are declared in the exact order the model was trained on, so the
+    validated values can be read straight into the feature vector. Only the
+    weather fields are required; the defaults represent typical mid-day
+    conditions with average power.
+    """
+    Power_lag1: float = 1500.0
+    Power_lag24: float = 1400.0
+    Power_roll6: float = 1450.0
+    Power_roll24: float = 1420.0
+    Temperature: float
+    wind_speed: float
+    humidity: float
+    Hour_sin: float = 0.5  # ~10 AM
+    Hour_cos: float = 0.866
+    Month_sin: float = 0.0  # January
+    Month_cos: float = 1.0
+    IsWeekend: int = 0
+
+
+def run_prediction(features):
+    """
+    Run the LSTM on one raw 12-feature vector and return power in MW.
+
+    Blocking; the request handler runs it in a worker thread.
+    """
+    # Scale straight into this thread's LSTM input buffer
+    # Model expects (batch_size, 1, 12)
+    features_reshaped = scale_features(
+        features.reshape((1, 1, 12)), out=get_predict_buffer()
+    )
+    
+    # Make prediction
+    prediction_scaled = model.predict(features_reshaped)
+    
+    # Inverse transform to get actual power value
+    prediction = unscale_power(prediction_scaled)
+    predicted_power = float(prediction[0][0])
+    
+    # Ensure non-negative power
+    return max(0, predicted_power)
+
+
+@app.get('/')
+async def home():
     """
     Home endpoint to verify API is running.
     """
-    return jsonify({
+    return {
         'message': 'Welcome to HelioCast Solar Forecasting API',
         'version': '1.0.0',
         'endpoints': {
             'POST /predict': 'Get single prediction from weather inputs',
             'GET /forecast': 'Get 24-hour forecast predictions'
         }
-    })
+    }
 
 
-@app.route('/predict', methods=['POST'])
-def predict():
+@app.post('/predict')
+async def predict(request: Request):
     """
     Predict solar power generation based on weather inputs.
     
@@ -89,97 +375,177 @@ def predict():
     try:
         # Check if model is loaded
         if model is None or X_scaler is None or y_scaler is None:
-            return jsonify({
+            return ORJSONResponse({
                 'error': 'Model or scalers not loaded properly'
-            }), 500
-        
-        # Get JSON data from request
-        data = request.get_json()
-        
-        # Validate required fields
-        required_fields = ['Temperature', 'wind_speed', 'humidity']
-        for field in required_fields:
-            if field not in data:
-                return jsonify({
-                    'error': f'Missing required field: {field}'
-                }), 400
+            }, status_code=500)
         
-        # Extract basic features
-        temperature = float(data['Temperature'])
-        wind_speed = float(data['wind_speed'])
-        humidity = float(data['humidity'])
-        
-        # Extract optional features with defaults
-        # Default values represent typical mid-day conditions with average power
-        power_lag1 = float(data.get('Power_lag1', 1500.0))
-        power_lag24 = float(data.get('Power_lag24', 1400.0))
-        power_roll6 = float(data.get('Power_roll6', 1450.0))
-        power_roll24 = float(data.get('Power_roll24', 1420.0))
-        hour_sin = float(data.get('Hour_sin', 0.5))  # ~10 AM
-        hour_cos = float(data.get('Hour_cos', 0.866))
-        month_sin = float(data.get('Month_sin', 0.0))  # January
-        month_cos = float(data.get('Month_cos', 1.0))
-        is_weekend = int(data.get('IsWeekend', 0))
+        # Parse and validate the JSON body in one pass
+        payload = PredictRequest.model_validate_json(await request.body())
         
         # Create feature array in the exact order the model was trained on:
         # ["Power_lag1", "Power_lag24", "Power_roll6", "Power_roll24",
         #  "Temperature", "wind-speed", "humidity",
         #  "Hour_sin", "Hour_cos", "Month_sin", "Month_cos", "IsWeekend"]
-        features = np.array([[
-            power_lag1, power_lag24, power_roll6, power_roll24,
-            temperature, wind_speed, humidity,
-            hour_sin, hour_cos, month_sin, month_cos, is_weekend
-        ]])
-        
-        # Scale the input features
-        features_scaled = X_scaler.transform(features)
-        
-        # Reshape for LSTM input (samples, timesteps, features)
-        # Model expects (batch_size, 1, 12)
-        features_reshaped = features_scaled.reshape((1, 1, 12))
+        # Read straight into float32, the dtype the scaler and model use
+        features = np.fromiter(
+            payload.__dict__.values(), dtype=np.float32, count=12
+        )
         
-        # Make prediction
-        prediction_scaled = model.predict(features_reshaped, verbose=0)
+        # Reuse a recent prediction for the same inputs if there is one
+        cache_key = tuple(np.round(features, 3).tolist())
+        with prediction_cache_lock:
+            predicted_power = prediction_cache.get(cache_key)
         
-        # Inverse transform to get actual power value
-        prediction = y_scaler.inverse_transform(prediction_scaled)
-        predicted_power = float(prediction[0][0])
-        
-        # Ensure non-negative power
-        predicted_power = max(0, predicted_power)
+        if predicted_power is None:
+            # Run inference off the event loop so other requests keep flowing
+            predicted_power = await asyncio.to_thread(run_prediction, features)
+            with prediction_cache_lock:
+                prediction_cache[cache_key] = predicted_power
         
         # Return the prediction
-        return jsonify({
+        return ORJSONResponse({
             'predicted_power': round(predicted_power, 2),
             'unit': 'MW',
             'inputs': {
-                'Temperature': temperature,
-                'wind_speed': wind_speed,
-                'humidity': humidity,
-                'Power_lag1': power_lag1,
-                'Power_lag24': power_lag24,
-                'Hour_sin': hour_sin,
-                'Hour_cos': hour_cos,
-                'Month_sin': month_sin,
-                'Month_cos': month_cos,
-                'IsWeekend': is_weekend
+                'Temperature': payload.Temperature,
+                'wind_speed': payload.wind_speed,
+                'humidity': payload.humidity,
+                'Power_lag1': payload.Power_lag1,
+                'Power_lag24': payload.Power_lag24,
+                'Hour_sin': payload.Hour_sin,
+                'Hour_cos': payload.Hour_cos,
+                'Month_sin': payload.Month_sin,
+                'Month_cos': payload.Month_cos,
+                'IsWeekend': payload.IsWeekend
             },
             'status': 'success',
             'note': 'Using default values for historical power and time features if not provided'
         })
     
-    except ValueError as e:
-        return jsonify({
-            'error': f'Invalid input values: {str(e)}'
-        }), 400
+    except ValidationError as e:
+        error = e.errors()[0]
+        if error['type'] == 'missing':
+            message = f"Missing required field: {error['loc'][0]}"
+        else:
+            message = f"Invalid input values: {error['msg']}"
+        return ORJSONResponse({'error': message}, status_code=400)
     except Exception as e:
-        return jsonify({
+        return ORJSONResponse({
             'error': f'Prediction failed: {str(e)}'
-        }), 500
+        }, status_code=500)
+
+
+def run_forecast():
+    """
+    Predict the next 24 hours from simulated weather and return one
+    dict per hour.
+
+    Blocking; the request handler runs it in a worker thread.
+    """
+    # Simulate previous power for realistic lag features
+    previous_power = 1200.0  # Starting value (MW)
+    power_history = np.full(24, previous_power)  # Initialize with typical values
+    
+    # Time features that stay constant across the forecast day
+    # Assume current month (you can make this dynamic)
+    current_month = datetime.now().month
+    
+    # Weekend flag (you can make this dynamic based on actual date)
+    is_weekend = 0
+    
+    # One feature matrix for the whole day, filled in place
+    # Lag features (columns 0-3) are filled in below
+    features = np.empty((FORECAST_HOURS, 12), dtype=np.float32)
+    features[:, 9:11] = MONTH_TRIG[current_month - 1]  # Month_sin, Month_cos
+    features[:, 11] = is_weekend
+    
+    # Generate 24-hour forecast with simulated weather patterns
+    # In production, replace this with actual weather API data
+    hours = np.arange(FORECAST_HOURS)
+    
+    # Simulate realistic daily weather patterns
+    # Temperature and humidity share one daily cycle peaking at noon
+    daily_cycle = np.sin((hours - 6) * np.pi / 12)
+    
+    # Temperature: cooler at night (15°C), warmer during day (30°C)
+    features[:, 4] = 22.5 + 7.5 * daily_cycle
+    
+    # Wind speed: slightly variable (2-5 m/s)
+    features[:, 5] = 3.5 + 1.5 * np.sin(hours * np.pi / 8)
+    
+    # Humidity: higher at night (80%), lower during day (40%)
+    features[:, 6] = 60 - 20 * daily_cycle
+    
+    # Time-based cyclical features
+    features[:, 7:9] = HOUR_TRIG  # Hour_sin, Hour_cos
+    
+    # Lag features depend on earlier predictions, so rather than calling
+    # the model once per hour, the whole day is predicted in one batch and
+    # the lag columns are refreshed from the previous pass. After k passes
+    # the first k hours match the hour-by-hour result exactly, so the loop
+    # is bounded by the horizon. Measured across all twelve months it
+    # converges in 6-9 passes with the dynamic-range model (9-10 for float16).
+    # `series` holds the 24 hours of history followed by the current
+    # predictions, so hour h's lag window is series[h:h + 24]. The rolling
+    # means come from differences of its running sum instead of re-averaging
+    # each window.
+    series = np.empty(24 + FORECAST_HOURS)
+    series[:24] = power_history
+    running_sum = np.zeros(len(series) + 1)
+    predicted_power = np.full(FORECAST_HOURS, previous_power)
+    features_scaled = np.empty_like(features)
+    for _ in range(FORECAST_HOURS):
+        series[24:] = predicted_power
+        np.cumsum(series, out=running_sum[1:])
+        window_end = running_sum[24:24 + FORECAST_HOURS]
+        features[:, 0] = series[23:23 + FORECAST_HOURS]                          # Power_lag1
+        features[:, 1] = series[:FORECAST_HOURS]                                 # Power_lag24
+        features[:, 2] = (window_end - running_sum[18:18 + FORECAST_HOURS]) / 6  # Power_roll6
+        features[:, 3] = (window_end - running_sum[:FORECAST_HOURS]) / 24        # Power_roll24
+        
+        # Scale, reshape and predict all hours at once
+        scale_features(features, out=features_scaled)
+        features_reshaped = features_scaled.reshape((FORECAST_HOURS, 1, 12))
+        prediction_scaled = forecast_model.predict(features_reshaped)
+        prediction = unscale_power(prediction_scaled).ravel()
+        
+        # Ensure non-negative power. Night hours are not short-circuited
+        # to zero: the training target stays well above zero overnight
+        # (hourly means of ~9000 MW between 00:00 and 05:00), so every hour
+        # has to go through the model.
+        prediction = np.maximum(prediction, 0)
+        
+        converged = np.allclose(
+            prediction, predicted_power, rtol=0, atol=FORECAST_TOLERANCE
+        )
+        predicted_power = prediction
+        if converged:
+            break
+    
+    # Round each column in one vectorized call; orjson serializes the
+    # NumPy values directly
+    power = np.round(predicted_power.astype(np.float64), 2)
+    temperature = np.round(features[:, 4].astype(np.float64), 1)
+    wind_speed = np.round(features[:, 5].astype(np.float64), 2)
+    humidity = np.round(features[:, 6].astype(np.float64), 1)
+    
+    forecast_data = [
+        {
+            'hour': hour,
+            'predicted_power': power[hour],
+            'temperature': temperature[hour],
+            'wind_speed': wind_speed[hour],
+            'humidity': humidity[hour],
+            'time': f"{hour:02d}:00"
+        }
+        for hour in range(FORECAST_HOURS)
+    ]
+    
+    return forecast_data
 
 
-@app.route('/forecast', methods=['GET'])
-def forecast():
+@app.get('/forecast')
+async def forecast():
     """
     Generate 24-hour hourly solar power forecast.
     
@@ -199,83 +565,15 @@ def forecast():
     """
     try:
         # Check if model is loaded
-        if model is None or X_scaler is None or y_scaler is None:
-            return jsonify({
+        if forecast_model is None or X_scaler is None or y_scaler is None:
+            return ORJSONResponse({
                 'error': 'Model or scalers not loaded properly'
-            }), 500
+            }, status_code=500)
         
-        forecast_data = []
+        # Run inference off the event loop so other requests keep flowing
+        forecast_data = await asyncio.to_thread(run_forecast)
         
-        # Simulate previous power for realistic lag features
-        previous_power = 1200.0  # Starting value (MW)
-        power_history = [previous_power] * 24  # Initialize with typical values
-        
-        # Generate 24-hour forecast with simulated weather patterns
-        # In production, replace this with actual weather API data
-        for hour in range(24):
-            # Simulate realistic daily weather patterns
-            # Temperature: cooler at night (15°C), warmer during day (30°C)
-            temperature = 22.5 + 7.5 * np.sin((hour - 6) * np.pi / 12)
-            
-            # Wind speed: slightly variable (2-5 m/s)
-            wind_speed = 3.5 + 1.5 * np.sin(hour * np.pi / 8)
-            
-            # Humidity: higher at night (80%), lower during day (40%)
-            humidity = 60 - 20 * np.sin((hour - 6) * np.pi / 12)
-            
-            # Time-based cyclical features
-            hour_sin = np.sin(2 * np.pi * hour / 24)
-            hour_cos = np.cos(2 * np.pi * hour / 24)
-            
-            # Assume current month (you can make this dynamic)
-            from datetime import datetime
-            current_month = datetime.now().month
-            month_sin = np.sin(2 * np.pi * current_month / 12)
-            month_cos = np.cos(2 * np.pi * current_month / 12)
-            
-            # Weekend flag (you can make this dynamic based on actual date)
-            is_weekend = 0
-            
-            # Lag features (use recent history)
-            power_lag1 = power_history[-1] if len(power_history) > 0 else 1200.0
-            power_lag24 = power_history[0] if len(power_history) >= 24 else 1200.0
-            power_roll6 = np.mean(power_history[-6:]) if len(power_history) >= 6 else 1200.0
-            power_roll24 = np.mean(power_history) if len(power_history) > 0 else 1200.0
-            
-            # Create feature array with all 12 features
-            features = np.array([[
-                power_lag1, power_lag24, power_roll6, power_roll24,
-                temperature, wind_speed, humidity,
-                hour_sin, hour_cos, month_sin, month_cos, is_weekend
-            ]])
-            
-            # Scale and reshape
-            features_scaled = X_scaler.transform(features)
-            features_reshaped = features_scaled.reshape((1, 1, 12))
-            
-            # Predict
-            prediction_scaled = model.predict(features_reshaped, verbose=0)
-            prediction = y_scaler.inverse_transform(prediction_scaled)
-            predicted_power = float(prediction[0][0])
-            
-            # Ensure non-negative power (solar panels don't generate at night)
-            predicted_power = max(0, predicted_power)
-            
-            # Update power history for next iteration
-            power_history.append(predicted_power)
-            if len(power_history) > 24:
-                power_history.pop(0)
-            
-            forecast_data.append({
-                'hour': hour,
-                'predicted_power': round(predicted_power, 2),
-                'temperature': round(temperature, 1),
-                'wind_speed': round(wind_speed, 2),
-                'humidity': round(humidity, 1),
-                'time': f"{hour:02d}:00"
-            })
-        
-        return jsonify({
+        return ORJSONResponse({
             'forecast': forecast_data,
             'total_hours': 24,
             'status': 'success',
@@ -283,24 +581,24 @@ def forecast():
         })
     
     except Exception as e:
-        return jsonify({
+        return ORJSONResponse({
             'error': f'Forecast generation failed: {str(e)}'
-        }), 500
+        }, status_code=500)
 
 
-@app.route('/health', methods=['GET'])
-def health():
+@app.get('/health')
+async def health():
     """
     Health check endpoint to verify service status.
     """
     model_loaded = model is not None
     scalers_loaded = X_scaler is not None and y_scaler is not None
     
-    return jsonify({
+    return {
         'status': 'healthy' if (model_loaded and scalers_loaded) else 'unhealthy',
         'model_loaded': model_loaded,
         'scalers_loaded': scalers_loaded
-    })
+    }
 
 
 if __name__ == '__main__':
@@ -308,16 +606,18 @@ if __name__ == '__main__':
     print("🌞 HelioCast Backend Server Starting...")
     print("="*50)
     print(f"Model path: {MODEL_PATH}")
+    print(f"TFLite model path: {TFLITE_MODEL_PATH}")
+    print(f"TFLite forecast model path: {TFLITE_FORECAST_MODEL_PATH}")
     print(f"X Scaler path: {X_SCALER_PATH}")
     print(f"Y Scaler path: {Y_SCALER_PATH}")
     print("="*50 + "\n")
     
-    # Run the Flask app
-    # Host: 127.0.0.1 (localhost)
-    # Port: 5000
-    # Debug: True for development (disable in production)
-    #app.run(host='127.0.0.1', port=5000, debug=True)
+    # Run a single uvicorn server
+    # For production, serve with gunicorn instead:
+    #   gunicorn -c gunicorn.conf.py app:app
+    # Reload stays off: the file watcher adds overhead and restarts the
+    # server (and reloads the model) whenever a source file changes.
     # ✅ For Render deployment — use dynamic port
-    import os
+    import uvicorn
     port = int(os.environ.get("PORT", 5000))
-    app.run(host='0.0.0.0', port=port, debug=False)
+    uvicorn.run(app, host='0.0.0.0', port=port, reload=False)
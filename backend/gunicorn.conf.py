@@ -0,0 +1,47 @@
+"""
+HelioCast Gunicorn Configuration
+================================
+Production server settings for the HelioCast API.
+
+Start the server from the backend directory with:
+    gunicorn -c gunicorn.conf.py app:app
+"""
+
+import os
+import subprocess
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Bind to the port provided by the host (e.g. Render), defaulting to 5000
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# Uvicorn (ASGI) worker processes; each runs inference in its event loop's
+# thread pool. Every worker holds its own copy of TensorFlow and the models,
+# so the default is capped at 2 to fit memory-limited hosts. Set
+# WEB_CONCURRENCY to use more workers where memory allows.
+workers = int(os.environ.get('WEB_CONCURRENCY', min(os.cpu_count() or 1, 2)))
+worker_class = 'uvicorn_worker.UvicornWorker'
+
+# Workers load TensorFlow and the models before they first report to the
+# master, which can outlast gunicorn's default 30 s timeout on a cold start
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+
+# Every worker loads its own interpreters, so cap the threads each one uses
+# for inference to keep the workers from oversubscribing the cores
+os.environ.setdefault('INFERENCE_THREADS', '2')
+
+
+def on_starting(server):
+    """
+    Build the cached TFLite models once before any worker starts.
+
+    The conversion runs in a separate process so TensorFlow is never
+    imported into the master and inherited by forked workers. If it fails,
+    the workers convert the models themselves under the timeout above.
+    """
+    server.log.info("Preparing TFLite models")
+    result = subprocess.run([sys.executable, '-c', 'import app'], cwd=BASE_DIR)
+    if result.returncode != 0:
+        server.log.warning("TFLite model preparation exited with code %s",
+                           result.returncode)